@@ -1,19 +1,30 @@
 """
 Minimal video downloader for sites supported by yt-dlp.
 """
+import atexit
+import collections
+import contextlib
+import errno
+import functools
+import hashlib
+import json
 import logging
+import math
+import os
+import re
+import shlex
 import shutil
 import subprocess
 import sys
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Optional, Tuple
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
 
-
-try:
+if TYPE_CHECKING:  # pragma: no cover - typing only
     import yt_dlp
-except ImportError:
-    print("ERROR: 'yt-dlp' library not found. Install with: pip install yt-dlp", file=sys.stderr)
-    sys.exit(1)
 
 LOGGER = logging.getLogger(__name__)
 LOGGER.addHandler(logging.NullHandler())  # Avoid "No handler" warnings when library is imported
@@ -25,46 +36,228 @@ _YOUTUBE_USER_AGENT = (
     "(KHTML, like Gecko) Chrome/129.0.0.0 Safari/537.36"
 )
 _MINIMUM_YTDLP_VERSION = (2024, 9, 27)
+_FASTSTART_SUFFIXES = frozenset({".mp4", ".m4a", ".m4v", ".mov"})
+_FFMPEG_ENV_VAR = "VIDEODOWNLOADER_FFMPEG"
+# Checked in order before any PATH search; IMAGEIO_FFMPEG_EXE is imageio-ffmpeg's own override.
+_FFMPEG_OVERRIDE_ENV_VARS = (_FFMPEG_ENV_VAR, "IMAGEIO_FFMPEG_EXE")
+_SOCKET_TIMEOUT_SECONDS = 15
+_PREFLIGHT_TIMEOUT_SECONDS = 3
+_PREFLIGHT_CONCURRENCY = 16
+_FRAGMENT_DOWNLOADS = 8
+_DEFAULT_HTTP_CHUNK_SIZE = 10 * 1024 * 1024
+_READ_BUFFER_SIZE = 1024 * 1024
+_DOWNLOAD_RETRIES = 3
+_MAX_RETRY_SLEEP_SECONDS = 10
+# yt-dlp merges these into a fresh HTTPHeaderDict per instance, so the shared mapping is never mutated.
+_DEFAULT_HTTP_HEADERS = MappingProxyType({"User-Agent": _YOUTUBE_USER_AGENT, "Connection": "keep-alive"})
+
+
+class _YdlLogger:
+    """Route yt-dlp's console output into LOGGER instead of writing to the terminal."""
+
+    def debug(self, message: str) -> None:
+        LOGGER.debug(message)
+
+    def info(self, message: str) -> None:
+        LOGGER.debug(message)
+
+    def warning(self, message: str) -> None:
+        # yt-dlp hands a custom logger every warning regardless of no_warnings; keep them suppressed.
+        LOGGER.debug(message)
+
+    def error(self, message: str) -> None:
+        # Real failures surface once through _log_download_error; fallbacks that recover stay quiet.
+        LOGGER.debug(message)
+
+
+def _retry_sleep(attempt: int) -> float:
+    """Exponential back-off before re-requesting a stalled chunk or fragment."""
+    return min(2 ** attempt, _MAX_RETRY_SLEEP_SECONDS)
+
+
+# Options identical for every download; read-only so per-call copies can't leak changes back.
+_BASE_YDL_OPTS = MappingProxyType(
+    {
+        "noplaylist": True,
+        "quiet": True,
+        "no_warnings": True,
+        # quiet alone does not stop yt-dlp redrawing its progress bar on every chunk.
+        "noprogress": True,
+        "logger": _YdlLogger(),
+        "color": "no_color",
+        "socket_timeout": _SOCKET_TIMEOUT_SECONDS,
+        # Give up on a stalled request quickly and retry it on a fresh connection.
+        "retries": _DOWNLOAD_RETRIES,
+        "fragment_retries": _DOWNLOAD_RETRIES,
+        "retry_sleep_functions": MappingProxyType({"http": _retry_sleep, "fragment": _retry_sleep}),
+        # Start reads at 1 MiB instead of 1 KiB; yt-dlp still shrinks the buffer on slow links.
+        "buffersize": _READ_BUFFER_SIZE,
+        "http_headers": _DEFAULT_HTTP_HEADERS,
+    }
+)
+# Format selection depends only on whether ffmpeg can merge separate audio/video streams.
+_BASE_YDL_OPTS_FFMPEG = MappingProxyType({**_BASE_YDL_OPTS, "format": "bv*+ba/b", "merge_output_format": "mp4"})
+_BASE_YDL_OPTS_NOFFMPEG = MappingProxyType({**_BASE_YDL_OPTS, "format": "best"})
+# Opt-in: take a single pre-muxed mp4 when the site offers one, skipping the second stream and the merge.
+_PREMUXED_FORMAT = "b[ext=mp4]/bv*+ba/b"
+
+
+_VERSION_FRAGMENT_RE = re.compile(r"\d+")
 
 
 def _parse_version_tuple(raw: str) -> Tuple[int, ...]:
     """Best-effort conversion of a version string into a comparable tuple."""
     parts: List[int] = []
     for fragment in raw.split("."):
-        numeric = "".join(ch for ch in fragment if ch.isdigit())
-        if not numeric:
+        match = _VERSION_FRAGMENT_RE.match(fragment)
+        if match is None:
             break
-        parts.append(int(numeric))
+        parts.append(int(match.group()))
     return tuple(parts)
 
 
-_YTDLP_VERSION_STRING = getattr(getattr(yt_dlp, "version", None), "__version__", None) or getattr(
-    yt_dlp, "__version__", "0"
-)
-_YTDLP_VERSION = _parse_version_tuple(_YTDLP_VERSION_STRING)
-if _YTDLP_VERSION and _YTDLP_VERSION < _MINIMUM_YTDLP_VERSION:
-    LOGGER.warning(
-        "yt-dlp %s detected; version %s or newer is recommended for reliable YouTube downloads. "
-        "Upgrade with 'pip install --upgrade yt-dlp'.",
-        _YTDLP_VERSION_STRING,
-        ".".join(str(part) for part in _MINIMUM_YTDLP_VERSION),
-    )
+_yt_dlp = None
+_YT_DLP_LOCK = threading.Lock()
+_YTDLP_VERSION_STRING = "0"
+_YTDLP_VERSION: Tuple[int, ...] = ()
+
+
+def _load_yt_dlp():
+    """Import yt-dlp on first use; loading its extractors is the bulk of this module's startup cost."""
+    global _yt_dlp, _YTDLP_VERSION_STRING, _YTDLP_VERSION
+    if _yt_dlp is not None:
+        return _yt_dlp
+    with _YT_DLP_LOCK:
+        if _yt_dlp is not None:
+            return _yt_dlp
+        try:
+            import yt_dlp
+        except ImportError:
+            print("ERROR: 'yt-dlp' library not found. Install with: pip install yt-dlp", file=sys.stderr)
+            sys.exit(1)
+
+        _YTDLP_VERSION_STRING = getattr(getattr(yt_dlp, "version", None), "__version__", None) or getattr(
+            yt_dlp, "__version__", "0"
+        )
+        _YTDLP_VERSION = _parse_version_tuple(_YTDLP_VERSION_STRING)
+        if _YTDLP_VERSION and _YTDLP_VERSION < _MINIMUM_YTDLP_VERSION:
+            LOGGER.warning(
+                "yt-dlp %s detected; version %s or newer is recommended for reliable YouTube downloads. "
+                "Upgrade with 'pip install --upgrade yt-dlp'.",
+                _YTDLP_VERSION_STRING,
+                ".".join(str(part) for part in _MINIMUM_YTDLP_VERSION),
+            )
+        _yt_dlp = yt_dlp
+    return _yt_dlp
+
+
+_PREWARM_STARTED = threading.Event()
+
+
+def _prewarm_yt_dlp() -> None:
+    """Import yt-dlp and its extractor registry on a background thread (once per process).
+
+    Lets the CLI overlap that import with argument validation and directory setup
+    instead of paying for it on the first URL.
+    """
+    if _PREWARM_STARTED.is_set():
+        return
+    _PREWARM_STARTED.set()
+
+    def _prewarm() -> None:
+        try:
+            _load_yt_dlp().extractor.gen_extractor_classes()
+        except SystemExit:
+            # Missing yt-dlp; the foreground import reports it and exits.
+            return
+        except Exception:  # pragma: no cover - defensive
+            LOGGER.debug("yt-dlp prewarm failed", exc_info=True)
+
+    threading.Thread(target=_prewarm, name="yt-dlp-prewarm", daemon=True).start()
 
 
 def yt_dlp_version_status() -> Tuple[str, str, bool]:
     """Return (current_version, minimum_required, is_outdated)."""
+    _load_yt_dlp()
     minimum_string = ".".join(str(part) for part in _MINIMUM_YTDLP_VERSION)
     is_outdated = bool(_YTDLP_VERSION and _YTDLP_VERSION < _MINIMUM_YTDLP_VERSION)
     return _YTDLP_VERSION_STRING, minimum_string, is_outdated
 
 
+def _ffmpeg_cache_file() -> Path:
+    if os.name == "nt":
+        cache_root = os.environ.get("LOCALAPPDATA") or os.path.join(os.path.expanduser("~"), "AppData", "Local")
+    else:
+        cache_root = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(cache_root) / "video_downloader" / "ffmpeg_path.json"
+
+
+def _path_hash() -> str:
+    return hashlib.blake2b(os.environ.get("PATH", "").encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _read_ffmpeg_cache() -> Optional[str]:
+    """Return the ffmpeg path cached by an earlier run, if PATH is unchanged and the binary still exists."""
+    try:
+        data = json.loads(_ffmpeg_cache_file().read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("path_hash") != _path_hash():
+        return None
+    cached = data.get("ffmpeg_path")
+    if isinstance(cached, str) and os.path.isfile(cached):
+        return cached
+    return None
+
+
+def _write_ffmpeg_cache(path: Path) -> None:
+    cache_file = _ffmpeg_cache_file()
+    payload = json.dumps({"path_hash": _path_hash(), "ffmpeg_path": str(path)})
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_name = tempfile.mkstemp(prefix=".ffmpeg_path_", suffix=".json", dir=cache_file.parent)
+    except OSError as exc:
+        LOGGER.debug("Unable to write ffmpeg cache %s: %s", cache_file, exc)
+        return
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            handle.write(payload)
+        os.replace(temp_name, cache_file)
+    except OSError as exc:
+        LOGGER.debug("Unable to write ffmpeg cache %s: %s", cache_file, exc)
+        try:
+            os.unlink(temp_name)
+        except OSError:
+            pass
+
+
+def _remember_ffmpeg(path: Path, persist: bool = True) -> Tuple[Optional[Path], bool]:
+    """Export the resolved binary so child interpreters and later runs can skip the lookup."""
+    os.environ[_FFMPEG_ENV_VAR] = str(path)
+    if persist:
+        _write_ffmpeg_cache(path)
+    return path, True
+
+
+@functools.lru_cache(maxsize=None)
 def _locate_ffmpeg() -> Tuple[Optional[Path], bool]:
     """Find ffmpeg either on PATH or via imageio-ffmpeg."""
+    for env_var in _FFMPEG_OVERRIDE_ENV_VARS:
+        configured = os.environ.get(env_var)
+        if configured and os.path.isfile(configured):
+            LOGGER.debug("Using ffmpeg from %s at %s", env_var, configured)
+            return _remember_ffmpeg(Path(configured), persist=False)
+
+    cached = _read_ffmpeg_cache()
+    if cached:
+        LOGGER.debug("Using cached ffmpeg location %s", cached)
+        return _remember_ffmpeg(Path(cached), persist=False)
+
     LOGGER.debug("Searching for ffmpeg on PATH.")
     binary = shutil.which("ffmpeg")
     if binary:
         LOGGER.info("ffmpeg located on PATH at %s", binary)
-        return Path(binary), True
+        return _remember_ffmpeg(Path(binary))
 
     try:
         import imageio_ffmpeg
@@ -75,27 +268,222 @@ def _locate_ffmpeg() -> Tuple[Optional[Path], bool]:
     try:
         downloaded = Path(imageio_ffmpeg.get_ffmpeg_exe())
         LOGGER.info("Using ffmpeg from imageio-ffmpeg at %s", downloaded)
-        return downloaded, True
+        return _remember_ffmpeg(downloaded)
     except Exception as exc:  # pragma: no cover - defensive
         LOGGER.warning("Failed to provision ffmpeg via imageio-ffmpeg: %s", exc)
         return None, False
 
 
-FFMPEG_PATH, FFMPEG_AVAILABLE = _locate_ffmpeg()
+def ffmpeg_path() -> Optional[Path]:
+    """Return the ffmpeg binary, locating it on first use rather than at import."""
+    return _locate_ffmpeg()[0]
+
+
+def ffmpeg_available() -> bool:
+    """Return True when an ffmpeg binary could be located."""
+    return _locate_ffmpeg()[1]
+
+
+@functools.lru_cache(maxsize=None)
+def _ffmpeg_path_str() -> str:
+    # Stringified once: both the yt-dlp option and every clip command need the plain str form.
+    path = ffmpeg_path()
+    return str(path) if path else "ffmpeg"
+
+
+def __getattr__(name: str):
+    # FFMPEG_PATH / FFMPEG_AVAILABLE used to be computed at import; keep them importable.
+    if name == "FFMPEG_PATH":
+        return ffmpeg_path()
+    if name == "FFMPEG_AVAILABLE":
+        return ffmpeg_available()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _env_int(name: str, default: int) -> int:
+    """Read an integer tuning knob from the environment, falling back on bad values."""
+    raw = os.environ.get(name, "").strip()
+    if not raw:
+        return default
+    try:
+        return int(raw)
+    except ValueError:
+        LOGGER.warning("Ignoring non-integer %s=%r; using %s.", name, raw, default)
+        return default
+
+
+_CPU_COUNT = os.cpu_count() or 1
+# HLS/DASH segments fetched in parallel per video; 1 restores yt-dlp's serial default.
+_CONCURRENT_FRAGMENTS = _env_int("VIDEODOWNLOADER_CONCURRENT_FRAGMENTS", _FRAGMENT_DOWNLOADS)
+# Ranged-GET size for progressive downloads; 0 leaves yt-dlp's default single request.
+_HTTP_CHUNK_SIZE = _env_int("VIDEODOWNLOADER_HTTP_CHUNK_SIZE", _DEFAULT_HTTP_CHUNK_SIZE)
+_FFMPEG_WORKERS = _env_int("VIDEODOWNLOADER_FFMPEG_WORKERS", min(16, _CPU_COUNT))
+# 0 means "derive from the pool size"; see _ffmpeg_threads_per_invocation.
+_FFMPEG_THREADS = _env_int("VIDEODOWNLOADER_FFMPEG_THREADS", 0)
+_FFMPEG_POOL: Optional[ThreadPoolExecutor] = None
+_DOWNLOAD_WORKERS = _env_int("VIDEODOWNLOADER_DOWNLOAD_WORKERS", min(4, _CPU_COUNT))
+# Pools kept warm, least recently used first; older ones are retired past _MAX_DOWNLOAD_POOLS.
+_DOWNLOAD_POOLS: "collections.OrderedDict[int, Tuple[ThreadPoolExecutor, Dict[int, yt_dlp.YoutubeDL]]]" = (
+    collections.OrderedDict()
+)
+_MAX_DOWNLOAD_POOLS = 4
+_DOWNLOAD_POOLS_LOCK = threading.Lock()
+_PREFER_PREMUXED = _env_int("VIDEODOWNLOADER_PREFER_PREMUXED", 0) > 0
+_FFMPEG_POOL_LOCK = threading.Lock()
+# Set on ffmpeg pool threads so work already running there is not queued behind itself.
+_FFMPEG_WORKER = threading.local()
+
+
+def _track_thread_youtube_dl(registry: Dict[int, "yt_dlp.YoutubeDL"]) -> None:
+    # Pool initializer: _open_youtube_dl records this thread's cached YoutubeDL in the pool's registry.
+    _YDL_LOCAL.registry = registry
+
+
+def _retire_download_pool(pool: ThreadPoolExecutor, registry: Dict[int, "yt_dlp.YoutubeDL"]) -> None:
+    """Let a dropped pool finish its queued work, then close the YoutubeDL each of its threads cached."""
+    pool.shutdown(wait=True)
+    for ydl in list(registry.values()):
+        try:
+            ydl.close()
+        except Exception:  # pragma: no cover - defensive
+            LOGGER.debug("Failed to close a cached YoutubeDL", exc_info=True)
+    registry.clear()
+
+
+def _download_pool(workers: int) -> ThreadPoolExecutor:
+    """Return a long-lived download pool with ``workers`` threads.
+
+    The threads outlive each batch so the YoutubeDL each one caches
+    (see _open_youtube_dl) stays warm for the next call. At most
+    _MAX_DOWNLOAD_POOLS sizes are kept; the least recently used one is retired.
+    """
+    with _DOWNLOAD_POOLS_LOCK:
+        entry = _DOWNLOAD_POOLS.get(workers)
+        if entry is not None:
+            _DOWNLOAD_POOLS.move_to_end(workers)
+            return entry[0]
+        registry: Dict[int, "yt_dlp.YoutubeDL"] = {}
+        pool = ThreadPoolExecutor(
+            max_workers=workers,
+            thread_name_prefix="video-download",
+            initializer=_track_thread_youtube_dl,
+            initargs=(registry,),
+        )
+        _DOWNLOAD_POOLS[workers] = (pool, registry)
+        if len(_DOWNLOAD_POOLS) > _MAX_DOWNLOAD_POOLS:
+            _, retired = _DOWNLOAD_POOLS.popitem(last=False)
+            # Retire off-thread so this caller never waits on another batch's downloads.
+            threading.Thread(
+                target=_retire_download_pool, args=retired, name="video-download-retire", daemon=True
+            ).start()
+    return pool
+
+
+@atexit.register
+def _close_download_pools() -> None:
+    """Close every pooled thread's YoutubeDL at exit so cookies and session state are written back."""
+    with _DOWNLOAD_POOLS_LOCK:
+        pools = list(_DOWNLOAD_POOLS.values())
+        _DOWNLOAD_POOLS.clear()
+    for pool, registry in pools:
+        _retire_download_pool(pool, registry)
+
+
+def _mark_ffmpeg_worker() -> None:
+    _FFMPEG_WORKER.active = True
+
+
+def _ffmpeg_pool() -> Optional[ThreadPoolExecutor]:
+    """Return the shared ffmpeg worker pool, or None when disabled (VIDEODOWNLOADER_FFMPEG_WORKERS=0)."""
+    global _FFMPEG_POOL
+    if _FFMPEG_WORKERS <= 0:
+        return None
+    if _FFMPEG_POOL is None:
+        with _FFMPEG_POOL_LOCK:
+            if _FFMPEG_POOL is None:
+                _FFMPEG_POOL = ThreadPoolExecutor(
+                    max_workers=_FFMPEG_WORKERS,
+                    thread_name_prefix="ffmpeg",
+                    initializer=_mark_ffmpeg_worker,
+                )
+    return _FFMPEG_POOL
+
+
+def _ffmpeg_threads_per_invocation() -> int:
+    """Split the cores across pool workers so concurrent ffmpeg processes do not oversubscribe them."""
+    if _FFMPEG_THREADS > 0:
+        return _FFMPEG_THREADS
+    return max(1, _CPU_COUNT // max(1, _FFMPEG_WORKERS))
+
+
+# Keep ffmpeg from flashing a console window for every clip on Windows.
+_SUBPROCESS_FLAGS = getattr(subprocess, "CREATE_NO_WINDOW", 0)
+# On POSIX, CPython only launches via posix_spawn (no fork of this process's address space)
+# when close_fds is off and the executable is a path. Descriptors are non-inheritable by
+# default (PEP 446), so nothing extra leaks into ffmpeg.
+_CLOSE_FDS = os.name == "nt"
+if os.name == "posix" and not getattr(subprocess, "_USE_POSIX_SPAWN", False):
+    LOGGER.debug("posix_spawn unavailable; ffmpeg will be started with fork/exec.")
+
+
+# Only the tail of ffmpeg's stderr is kept; the last lines carry the actual error.
+_FFMPEG_STDERR_TAIL_BYTES = 8 * 1024
+
+
+def _drain_stderr(stream, tail: "collections.deque") -> None:
+    for line in iter(stream.readline, b""):
+        tail.append(line)
+    stream.close()
 
 
+def _spawn_ffmpeg(command: List[str]) -> subprocess.CompletedProcess:
+    # stdout is never read; stderr is drained on a thread into a bounded buffer so chatty
+    # clips neither grow memory nor stall on a full pipe. It stays bytes until a failure needs it.
+    process = subprocess.Popen(
+        command,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        close_fds=_CLOSE_FDS,
+        creationflags=_SUBPROCESS_FLAGS,
+    )
+    tail: collections.deque = collections.deque(maxlen=64)
+    reader = threading.Thread(target=_drain_stderr, args=(process.stderr, tail), daemon=True)
+    reader.start()
+    returncode = process.wait()
+    reader.join()
+    stderr = b"".join(tail)[-_FFMPEG_STDERR_TAIL_BYTES:]
+    return subprocess.CompletedProcess(command, returncode, None, stderr)
+
+
+def _run_ffmpeg(command: List[str]) -> subprocess.CompletedProcess:
+    """Run an ffmpeg command, queueing it on the worker pool so concurrent clips never exceed vCPUs."""
+    pool = _ffmpeg_pool()
+    if pool is None or getattr(_FFMPEG_WORKER, "active", False):
+        return _spawn_ffmpeg(command)
+    return pool.submit(_spawn_ffmpeg, command).result()
+
+
+@functools.lru_cache(maxsize=None)
 def _ffmpeg_location_arg() -> Optional[str]:
-    if not FFMPEG_PATH:
+    """The ``ffmpeg_location`` value for yt-dlp, resolved once per process."""
+    if not ffmpeg_path():
         return None
-    return str(FFMPEG_PATH)
+    return _ffmpeg_path_str()
 
 
 def configure_logging(level: str = "INFO") -> None:
-    """Configure root logging for CLI usage."""
+    """Configure root logging for CLI usage; repeated calls only change the level."""
     resolved = getattr(logging, level.upper(), logging.INFO)
-    logging.basicConfig(level=resolved, format=_LOG_FORMAT, datefmt=_LOG_DATEFMT)
+    root_logger = logging.getLogger()
+    if not root_logger.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter(_LOG_FORMAT, _LOG_DATEFMT))
+        root_logger.addHandler(handler)
+    root_logger.setLevel(resolved)
     LOGGER.setLevel(resolved)
 
+
 def parse_time_to_seconds(value: Optional[str]) -> Optional[float]:
     """Parse a human-friendly time string (e.g. 1:23:45) into seconds."""
     if value is None:
@@ -110,59 +498,177 @@ def parse_time_to_seconds(value: Optional[str]) -> Optional[float]:
     text = str(value).strip()
     if not text:
         return None
+    return _parse_time_text(text)
 
-    try:
-        parsed = yt_dlp.utils.parse_duration(text)
-    except Exception:  # pragma: no cover - defensive
-        parsed = None
 
+# [[D:]HH:]MM:SS or plain seconds, with optional fractional seconds.
+_CLOCK_TIME_RE = re.compile(r"(?:(?:(?:(\d+):)?(\d+):)?(\d+):)?(\d+(?:\.\d*)?|\.\d+)")
+
+
+def _parse_clock_time(text: str) -> Optional[float]:
+    """Parse clock-style times without importing yt-dlp."""
+    match = _CLOCK_TIME_RE.fullmatch(text)
+    if match is None:
+        return None
+    days, hours, minutes, seconds = match.groups()
+    return int(days or 0) * 86400 + int(hours or 0) * 3600 + int(minutes or 0) * 60 + float(seconds)
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_time_text(text: str) -> Optional[float]:
+    """Parse a stripped time string; cached because batch CSVs repeat the same timestamps."""
+    parsed = _parse_clock_time(text)
     if parsed is not None:
-        return float(parsed)
+        return parsed
 
+    # Only unit-suffixed spellings (e.g. "1h30m") need yt-dlp's more permissive parser.
+    if any(char.isalpha() for char in text):
+        try:
+            parsed = _load_yt_dlp().utils.parse_duration(text)
+        except Exception:  # pragma: no cover - defensive
+            parsed = None
+        if parsed is not None:
+            return float(parsed) if parsed >= 0 else None
+
+    # Float literals such as "1e3" or "+90" are still plain seconds.
     try:
         numeric = float(text)
     except ValueError:
         return None
-    if numeric < 0:
+    if numeric < 0 or not math.isfinite(numeric):
         return None
     return numeric
 
 
+def _next_clip_path(source: Path) -> Path:
+    """Atomically reserve a unique clip path beside the source (O_EXCL create, no probe loop)."""
+    fd, name = tempfile.mkstemp(prefix=f"{source.stem}_clip_", suffix=source.suffix or ".mp4", dir=source.parent)
+    os.close(fd)
+    try:
+        # mkstemp creates 0600 files; keep the download's permissions once the clip replaces it.
+        shutil.copymode(source, name)
+    except OSError:
+        os.unlink(name)
+        raise
+    return Path(name)
 
-def _format_ffmpeg_time(seconds: float) -> str:
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = seconds - hours * 3600 - minutes * 60
-    if abs(secs - round(secs)) < 1e-3:
-        secs_str = f"{int(round(secs)):02d}"
-    else:
-        secs_str = f"{secs:06.3f}".rstrip("0").rstrip(".")
-        if secs_str == "":
-            secs_str = "00"
-    return f"{hours:02d}:{minutes:02d}:{secs_str}"
 
-def _next_clip_path(source: Path) -> Path:
-    suffix = source.suffix or ".mp4"
-    candidate = source.with_name(f"{source.stem}_clip{suffix}")
-    counter = 1
-    while candidate.exists():
-        candidate = source.with_name(f"{source.stem}_clip_{counter}{source.suffix}")
-        counter += 1
-    return candidate
+def _remove_temp_clip(temp_target: Path) -> None:
+    if temp_target.exists():
+        try:
+            temp_target.unlink()
+        except OSError:
+            LOGGER.warning("Failed to remove temporary clip file at %s", temp_target)
+
+
+def _fsync_path(path: Path, directory: bool = False) -> None:
+    flags = os.O_RDONLY | (getattr(os, "O_DIRECTORY", 0) if directory else 0)
+    fd = os.open(str(path), flags)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
 
+def _replace_file(source: Path, target: Path, durable: bool = False) -> None:
+    """Move source over target atomically, falling back to a copy across filesystems.
 
-def _clip_media(source: Path, start: Optional[float], end: Optional[float]) -> Optional[Path]:
-    if not FFMPEG_AVAILABLE:
+    With durable=True the data and the directory entry are fsynced so the
+    replacement survives a crash; this costs extra disk flushes and is off by default.
+    """
+    if durable:
+        _fsync_path(source)
+    try:
+        os.replace(source, target)
+    except OSError as exc:
+        if exc.errno != errno.EXDEV:
+            raise
+        shutil.move(str(source), str(target))
+    if durable and os.name == "posix":
+        _fsync_path(target.parent, directory=True)
+
+
+def _remux_with_pyav(
+    source: Path,
+    target: Path,
+    start: Optional[float],
+    end: Optional[float],
+    faststart: bool = False,
+) -> bool:
+    """Stream-copy the clip in-process with PyAV (libav) instead of spawning ffmpeg.
+
+    Mirrors the ffmpeg fast path: seek to the keyframe at or before ``start``,
+    copy packets until ``end`` and let the muxer rebase timestamps to zero.
+    Returns False when PyAV is not installed or the remux fails so the caller
+    can fall back to the ffmpeg binary.
+    """
+    try:
+        import av
+    except ImportError:
+        return False
+
+    options = {"avoid_negative_ts": "make_zero"}
+    if faststart and target.suffix.lower() in _FASTSTART_SUFFIXES:
+        options["movflags"] = "+faststart"
+    try:
+        with av.open(str(source)) as container, av.open(str(target), mode="w", options=options) as output:
+            # Video and audio only, like the ffmpeg fallback's -map 0:v? -map 0:a?.
+            in_streams = [stream for stream in container.streams if stream.type in ("video", "audio")]
+            # PyAV 14 renamed add_stream(template=...) to add_stream_from_template().
+            add_from_template = getattr(output, "add_stream_from_template", None)
+            stream_map = {
+                stream.index: add_from_template(stream) if add_from_template else output.add_stream(template=stream)
+                for stream in in_streams
+            }
+            base = (container.start_time or 0) / av.time_base
+            if start:
+                container.seek(int((start + base) * av.time_base), backward=True)
+
+            finished = set()
+            for packet in container.demux(in_streams):
+                timestamp = packet.pts if packet.pts is not None else packet.dts
+                if timestamp is None:
+                    continue  # demuxer flush packet
+                if end is not None and float(timestamp * packet.time_base) - base >= end:
+                    finished.add(packet.stream.index)
+                    if len(finished) == len(stream_map):
+                        break
+                    continue
+                packet.stream = stream_map[packet.stream.index]
+                output.mux(packet)
+    except Exception as exc:
+        LOGGER.debug("PyAV remux of %s failed (%s); falling back to ffmpeg.", source, exc)
+        return False
+    return True
+
+
+def _clip_media(
+    source: Path,
+    start: Optional[float],
+    end: Optional[float],
+    durable: bool = False,
+    faststart: bool = False,
+) -> Optional[Path]:
+    """Clip ``source`` in place with a stream copy.
+
+    ``faststart`` moves the MP4 index to the front so the clip can be streamed
+    before it is fully downloaded; it costs the muxer a second pass over the file.
+    """
+    if not ffmpeg_available():
         LOGGER.error("Clipping requested but ffmpeg is not available.")
         return None
     if not source.exists():
         LOGGER.error("Cannot clip %s because the file does not exist.", source)
         return None
 
-    temp_target = _next_clip_path(source)
-    command = [str(FFMPEG_PATH or "ffmpeg"), "-hide_banner", "-loglevel", "error", "-y"]
+    command = [_ffmpeg_path_str(), "-hide_banner", "-nostdin", "-nostats", "-loglevel", "error", "-y"]
+    # Local downloads describe their streams in the container header, so skip ffmpeg's probe
+    # phase and input buffering instead of paying the default analyze delay on every clip.
+    command += ["-fflags", "+nobuffer", "-probesize", "32", "-analyzeduration", "0"]
     if start is not None:
-        command += ["-ss", _format_ffmpeg_time(start)]
+        # Input-side seek only: with -c copy an output-side -ss drops every packet up to the
+        # next keyframe after the offset, losing the start of the clip.
+        command += ["-ss", f"{start:.6f}"]
     command += ["-i", str(source)]
 
     if end is not None:
@@ -170,25 +676,40 @@ def _clip_media(source: Path, start: Optional[float], end: Optional[float]) -> O
         if duration <= 0:
             LOGGER.error("Clip end time must be greater than clip start time.")
             return None
-        command += ["-t", _format_ffmpeg_time(duration)]
-
-    command += ["-c", "copy", str(temp_target)]
-    LOGGER.debug("Running ffmpeg clip command: %s", command)
+        command += ["-t", f"{duration:.6f}"]
 
-    completed = subprocess.run(command, capture_output=True, text=True)
-    if completed.returncode != 0:
-        stderr = (completed.stderr or "").strip()
-        stdout = (completed.stdout or "").strip()
-        LOGGER.error("ffmpeg failed to clip %s: %s", source, stderr or stdout or "Unknown error.")
-        if temp_target.exists():
-            try:
-                temp_target.unlink()
-            except OSError:
-                LOGGER.warning("Failed to remove temporary clip file at %s", temp_target)
+    try:
+        temp_target = _next_clip_path(source)
+    except OSError as exc:
+        LOGGER.error("Unable to create temporary clip file next to %s: %s", source, exc)
         return None
 
+    if _remux_with_pyav(source, temp_target, start, end, faststart):
+        LOGGER.debug("Clipped %s in-process with PyAV", source)
+    else:
+        # Same stream set as _remux_with_pyav, so the clip doesn't depend on whether av is installed.
+        command += ["-map", "0:v?", "-map", "0:a?", "-c", "copy", "-avoid_negative_ts", "make_zero"]
+        command += ["-threads", str(_ffmpeg_threads_per_invocation())]
+        if faststart and temp_target.suffix.lower() in _FASTSTART_SUFFIXES:
+            command += ["-movflags", "+faststart"]
+        command.append(str(temp_target))
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug("Running ffmpeg clip command: %s", shlex.join(command))
+
+        try:
+            completed = _run_ffmpeg(command)
+        except OSError as exc:
+            LOGGER.error("Unable to run ffmpeg to clip %s: %s", source, exc)
+            _remove_temp_clip(temp_target)
+            return None
+        if completed.returncode != 0:
+            stderr = (completed.stderr or b"").decode("utf-8", errors="replace").strip()
+            LOGGER.error("ffmpeg failed to clip %s: %s", source, stderr or "Unknown error.")
+            _remove_temp_clip(temp_target)
+            return None
+
     try:
-        temp_target.replace(source)
+        _replace_file(temp_target, source, durable)
     except OSError as exc:
         LOGGER.error("Failed to replace original file with clipped media: %s", exc)
         try:
@@ -200,80 +721,241 @@ def _clip_media(source: Path, start: Optional[float], end: Optional[float]) -> O
     return source
 
 
+def clip_many(
+    sources: Iterable[Path],
+    ranges: Iterable[Tuple[Optional[float], Optional[float]]],
+    durable: bool = False,
+    faststart: bool = False,
+) -> List[Optional[Path]]:
+    """Clip several files in place on the shared ffmpeg pool.
+
+    ``ranges`` pairs each source with a ``(start, end)`` tuple in seconds.
+    Results are returned in input order; failed clips are ``None``.
+    """
+    jobs = list(zip(sources, ranges))
+    pool = _ffmpeg_pool()
+    if pool is None:
+        return [_clip_media(Path(source), start, end, durable, faststart) for source, (start, end) in jobs]
+    futures = [
+        pool.submit(_clip_media, Path(source), start, end, durable, faststart) for source, (start, end) in jobs
+    ]
+    return [future.result() for future in futures]
+
+
+@functools.lru_cache(maxsize=128)
 def _build_output_template(output_dir: Path, filename: Optional[str]) -> str:
-    """Ensure a custom filename still includes an extension placeholder."""
-    if not filename:
-        return str(output_dir / "%(title)s.%(ext)s")
+    """Ensure a custom filename still includes an extension placeholder.
 
-    cleaned = filename.strip()
+    Cached because batch runs rebuild the same template for every row.
+    """
+    cleaned = filename.strip() if filename else ""
     if not cleaned:
-        return str(output_dir / "%(title)s.%(ext)s")
-
-    if "%(ext" in cleaned:
+        template_name = "%(title)s.%(ext)s"
+    elif "%(ext" in cleaned or Path(cleaned).suffix:
         template_name = cleaned
     else:
-        candidate = Path(cleaned)
-        if candidate.suffix:
-            template_name = str(candidate)
-        else:
-            template_name = f"{cleaned}.%(ext)s"
-
-    return str(output_dir / template_name)
+        template_name = f"{cleaned}.%(ext)s"
+    return os.path.join(os.fspath(output_dir), template_name)
 
 
 def _log_download_error(url: str, message: str) -> None:
     """Log download errors with additional ffmpeg guidance when relevant."""
     LOGGER.error("Video download failed for %s: %s", url, message)
-    if "ffmpeg" in message.lower() and FFMPEG_AVAILABLE:
+    # Test the cheap flag first so the message is only lowercased when the hint could apply.
+    if ffmpeg_available() and "ffmpeg" in message.lower():
         LOGGER.warning(
             "ffmpeg was expected at %s but yt-dlp reported it missing. Check that the binary is executable.",
-            FFMPEG_PATH,
+            ffmpeg_path(),
         )
 
 
-def download_video(
+@functools.lru_cache(maxsize=None)
+def _base_ydl_opts() -> MappingProxyType:
+    """Pick the frozen base options once ffmpeg has been located, including its location."""
+    if not ffmpeg_available():
+        return _BASE_YDL_OPTS_NOFFMPEG
+    overrides = {}
+    if _PREFER_PREMUXED:
+        overrides["format"] = _PREMUXED_FORMAT
+    ffmpeg_location = _ffmpeg_location_arg()
+    if ffmpeg_location:
+        overrides["ffmpeg_location"] = ffmpeg_location
+    if not overrides:
+        return _BASE_YDL_OPTS_FFMPEG
+    return MappingProxyType({**_BASE_YDL_OPTS_FFMPEG, **overrides})
+
+
+def _build_ydl_options(
+    template: str,
+    cookies_path: Optional[Path],
+    username: Optional[str],
+    password: Optional[str],
+    extra: Optional[dict] = None,
+) -> dict:
+    """Assemble the yt-dlp options shared by every URL in a batch."""
+    ydl_opts: dict = {**_base_ydl_opts(), "outtmpl": template}
+
+    if cookies_path:
+        ydl_opts["cookiefile"] = os.fspath(cookies_path)
+
+    if username:
+        ydl_opts["username"] = username
+        if password:
+            ydl_opts["password"] = password
+
+    if extra:
+        ydl_opts.update(extra)
+
+    return ydl_opts
+
+
+def _expose_ffmpeg_location(yt_dlp) -> None:
+    """Point yt-dlp's section downloader at our ffmpeg.
+
+    Its availability check ignores the ``ffmpeg_location`` option and reads a
+    context variable that only the yt-dlp CLI sets, so a bundled ffmpeg that is
+    not on PATH would otherwise be reported as missing.
+    """
+    location = _ffmpeg_location_arg()
+    if not location:
+        return
+    try:
+        from yt_dlp.postprocessor.ffmpeg import FFmpegPostProcessor
+    except ImportError:  # pragma: no cover - layout differs on very old releases
+        return
+    context_var = getattr(FFmpegPostProcessor, "_ffmpeg_location", None)
+    if context_var is not None:
+        context_var.set(location)
+
+
+# One reusable YoutubeDL per thread: instances are not thread-safe, but keeping one alive
+# across calls keeps its extractor instances and HTTP connections warm.
+_YDL_LOCAL = threading.local()
+_NON_REUSABLE_YDL_OPTS = ("cookiefile", "username", "password", "download_ranges")
+
+
+def _open_youtube_dl(stack: contextlib.ExitStack, ydl_opts: dict) -> "yt_dlp.YoutubeDL":
+    """Return a YoutubeDL for ``ydl_opts``, reusing this thread's last one when only the template differs.
+
+    Instances that carry cookies, credentials or download ranges are built per
+    call and closed with ``stack``: cookies are loaded once and saved on close.
+    """
+    yt_dlp = _load_yt_dlp()
+    if any(ydl_opts.get(key) for key in _NON_REUSABLE_YDL_OPTS):
+        return stack.enter_context(yt_dlp.YoutubeDL(ydl_opts))
+
+    key = repr(sorted((name, value) for name, value in ydl_opts.items() if name != "outtmpl"))
+    cached = getattr(_YDL_LOCAL, "entry", None)
+    if cached is not None and cached[0] == key:
+        ydl = cached[1]
+        ydl.params["outtmpl"]["default"] = ydl_opts["outtmpl"]
+        return ydl
+    if cached is not None:
+        cached[1].close()
+    ydl = yt_dlp.YoutubeDL(ydl_opts)
+    _YDL_LOCAL.entry = (key, ydl)
+    registry = getattr(_YDL_LOCAL, "registry", None)
+    if registry is not None:
+        registry[threading.get_ident()] = ydl
+    return ydl
+
+
+# yt-dlp option names whose values must never reach the logs.
+_SECRET_YDL_OPTS = frozenset({"password", "videopassword", "ap_password"})
+
+
+def _sanitize_opts_for_log(ydl_opts: dict) -> dict:
+    """Return a copy of the yt-dlp options that is safe to write to logs."""
+    return {key: "***" if key in _SECRET_YDL_OPTS and value else value for key, value in ydl_opts.items()}
+
+
+def _extract_single(ydl: "yt_dlp.YoutubeDL", url: str) -> dict:
+    """Download one URL, resolving only the first entry when it points at a playlist.
+
+    Plain video URLs go straight through extract_info. URLs carrying a ``list=``
+    parameter are extracted without processing first so yt-dlp does not resolve
+    every playlist entry just to download one of them.
+    """
+    if "list=" not in url:
+        return ydl.extract_info(url, download=True)
+
+    ie_result = ydl.extract_info(url, download=False, process=False)
+    if ie_result.get("_type") in ("playlist", "multi_video"):
+        entry = next(iter(ie_result.get("entries") or ()), None)
+        if entry is None:
+            raise _load_yt_dlp().utils.DownloadError(f"No downloadable entries found for {url}")
+        LOGGER.info("%s is a playlist; downloading only its first entry.", url)
+        ie_result = entry
+    return ydl.process_ie_result(ie_result, download=True)
+
+
+def _download_with_opts(
+    ydl: "yt_dlp.YoutubeDL",
     url: str,
-    output_dir: Path,
-    filename: Optional[str] = None,
-    cookies_path: Optional[Path] = None,
-    username: Optional[str] = None,
-    password: Optional[str] = None,
-    clip_start: Optional[float] = None,
-    clip_end: Optional[float] = None,
+    clip_start_seconds: Optional[float],
+    clip_end_seconds: Optional[float],
+    durable: bool = False,
+    ranged_ydl: Optional["yt_dlp.YoutubeDL"] = None,
+    faststart: bool = False,
 ) -> Optional[Path]:
-    LOGGER.info("Starting download for %s", url)
-    output_dir = Path(output_dir)
-    LOGGER.debug("Resolved output directory to %s", output_dir)
+    """Download a single URL through an already configured YoutubeDL handle.
 
+    When ``ranged_ydl`` is given it is tried first to fetch only the clip
+    section; ``ydl`` then serves as the full-download fallback.
+    """
+    yt_dlp = _load_yt_dlp()
+    LOGGER.info("Starting download for %s", url)
     try:
-        output_dir.mkdir(parents=True, exist_ok=True)
-    except OSError as exc:
-        LOGGER.error("Unable to create output directory %s: %s", output_dir, exc)
-        return None
-
-    template = _build_output_template(output_dir, filename)
-    LOGGER.debug("Using output template %s", template)
-
-    resolved_cookies_path: Optional[Path] = None
-    if cookies_path:
-        candidate = Path(cookies_path)
-        if candidate.exists():
-            resolved_cookies_path = candidate
-            LOGGER.info("Using cookies file at %s", candidate)
+        info = None
+        if ranged_ydl is not None:
+            try:
+                info = _extract_single(ranged_ydl, url)
+            except yt_dlp.utils.DownloadError as err:
+                LOGGER.warning(
+                    "Section download failed for %s (%s); downloading the full file and clipping locally.",
+                    url,
+                    err,
+                )
+            else:
+                ydl = ranged_ydl
+                clip_start_seconds = clip_end_seconds = None
+        if info is None:
+            info = _extract_single(ydl, url)
+        try:
+            file_path = Path(info["requested_downloads"][0]["filepath"])
+        except (KeyError, IndexError):
+            # prepare_filename renders %(ext)s from the same info dict, so no suffix fix-up is needed.
+            file_path = Path(ydl.prepare_filename(info))
+            LOGGER.debug("Derived file path %s using metadata", file_path)
         else:
-            LOGGER.warning("Cookies path %s does not exist; continuing without cookies.", candidate)
+            LOGGER.debug("yt-dlp reported requested download path %s", file_path)
+        LOGGER.info("Downloaded %s -> %s", url, file_path)
+
+        if clip_start_seconds is not None or clip_end_seconds is not None:
+            LOGGER.info(
+                "Clipping downloaded file %s (start=%s, end=%s)",
+                file_path,
+                clip_start_seconds,
+                clip_end_seconds,
+            )
+            clipped_path = _clip_media(file_path, clip_start_seconds, clip_end_seconds, durable, faststart)
+            if clipped_path is None:
+                LOGGER.error("Clipping failed; keeping original download but reporting failure.")
+                return None
+            file_path = clipped_path
+
+        return file_path
+    except yt_dlp.utils.DownloadError as err:
+        _log_download_error(url, str(err))
+    except Exception:  # pragma: no cover - defensive
+        LOGGER.exception("Unexpected error during video download for %s", url)
+    return None
 
-    auth_username = username
-    auth_password: Optional[str] = None
-    if auth_username:
-        LOGGER.info("Using provided username for authentication.")
-        if password:
-            auth_password = password
-        else:
-            LOGGER.warning("Username provided without password; yt-dlp may prompt for additional credentials.")
-    elif password:
-        LOGGER.warning("Password provided without username; ignoring password.")
 
+def _validate_clip_range(
+    clip_start: Optional[float], clip_end: Optional[float]
+) -> Optional[Tuple[Optional[float], Optional[float]]]:
+    """Coerce clip bounds to floats once per batch; returns None (after logging) when invalid."""
     clip_start_seconds: Optional[float] = None
     clip_end_seconds: Optional[float] = None
 
@@ -305,84 +987,398 @@ def download_video(
         LOGGER.error("Clip end time must be greater than clip start time.")
         return None
 
-    if not FFMPEG_AVAILABLE:
+    return clip_start_seconds, clip_end_seconds
+
+
+def download_videos(
+    urls: Iterable[str],
+    output_dir: Path,
+    filename: Optional[str] = None,
+    cookies_path: Optional[Path] = None,
+    username: Optional[str] = None,
+    password: Optional[str] = None,
+    clip_start: Optional[float] = None,
+    clip_end: Optional[float] = None,
+    concurrent_fragments: Optional[int] = None,
+    http_chunk_size: Optional[int] = None,
+    durable: bool = False,
+    faststart: bool = False,
+) -> List[Optional[Path]]:
+    """Download several URLs through a single YoutubeDL instance.
+
+    Returns one entry per URL, in input order: the saved path or None on failure.
+    """
+    url_list = list(urls)
+    if not url_list:
+        return []
+    failed: List[Optional[Path]] = [None] * len(url_list)
+
+    clip_range = _validate_clip_range(clip_start, clip_end)
+    if clip_range is None:
+        return failed
+    clip_start_seconds, clip_end_seconds = clip_range
+
+    try:
+        # os.makedirs takes str or Path alike, so no Path is built just to create the directory.
+        os.makedirs(output_dir, exist_ok=True)
+    except OSError as exc:
+        LOGGER.error("Unable to create output directory %s: %s", output_dir, exc)
+        return failed
+
+    template = _build_output_template(output_dir, filename)
+    LOGGER.debug("Using output template %s", template)
+    if filename and len(url_list) > 1:
+        LOGGER.warning("Custom filename %s applies to every URL in the batch; downloads may collide.", filename)
+
+    resolved_cookies_path: Optional[Path] = None
+    if cookies_path:
+        candidate = cookies_path if isinstance(cookies_path, Path) else Path(cookies_path)
+        if candidate.exists():
+            resolved_cookies_path = candidate
+            LOGGER.info("Using cookies file at %s", candidate)
+        else:
+            LOGGER.warning("Cookies path %s does not exist; continuing without cookies.", candidate)
+
+    auth_username = username
+    auth_password: Optional[str] = None
+    if auth_username:
+        LOGGER.info("Using provided username for authentication.")
+        if password:
+            auth_password = password
+        else:
+            LOGGER.warning("Username provided without password; yt-dlp may prompt for additional credentials.")
+    elif password:
+        LOGGER.warning("Password provided without username; ignoring password.")
+
+    if not ffmpeg_available():
         LOGGER.warning(
             "ffmpeg not detected; falling back to best available single-file download without merging audio/video."
         )
 
-    ydl_opts: dict = {
-        "outtmpl": template,
-        "noplaylist": True,
-        "quiet": True,
-        "no_warnings": True,
-    }
-    if FFMPEG_AVAILABLE:
-        ydl_opts["format"] = "bv*+ba/b"
-        ydl_opts["merge_output_format"] = "mp4"
-        ffmpeg_location = _ffmpeg_location_arg()
-        if ffmpeg_location:
-            ydl_opts["ffmpeg_location"] = ffmpeg_location
-    else:
-        ydl_opts["format"] = "best"
-
-    if resolved_cookies_path:
-        ydl_opts["cookiefile"] = str(resolved_cookies_path)
+    # Fragmented (HLS/DASH) formats fetch segments serially unless told otherwise;
+    # pass concurrent_fragments=1 or http_chunk_size=0 to opt out.
+    if concurrent_fragments is None:
+        concurrent_fragments = _CONCURRENT_FRAGMENTS
+    if http_chunk_size is None:
+        http_chunk_size = _HTTP_CHUNK_SIZE
+    extra_opts: dict = {}
+    if concurrent_fragments and concurrent_fragments > 1:
+        extra_opts["concurrent_fragment_downloads"] = int(concurrent_fragments)
+    if http_chunk_size and http_chunk_size > 0:
+        extra_opts["http_chunk_size"] = int(http_chunk_size)
+
+    ydl_opts = _build_ydl_options(template, resolved_cookies_path, auth_username, auth_password, extra_opts)
+
+    yt_dlp = _load_yt_dlp()
+    ranged_opts: Optional[dict] = None
+    if ffmpeg_available() and (clip_start_seconds is not None or clip_end_seconds is not None):
+        # Fetch only the requested section instead of downloading everything and clipping afterwards.
+        ranged_opts = {
+            **ydl_opts,
+            "download_ranges": yt_dlp.utils.download_range_func(
+                None,
+                [(clip_start_seconds or 0, clip_end_seconds if clip_end_seconds is not None else float("inf"))],
+            ),
+            "force_keyframes_at_cuts": True,
+        }
+
+        _expose_ffmpeg_location(yt_dlp)
+
+    results: List[Optional[Path]] = []
+    try:
+        with contextlib.ExitStack() as stack:
+            ydl = _open_youtube_dl(stack, ydl_opts)
+            ranged_ydl = _open_youtube_dl(stack, ranged_opts) if ranged_opts else None
+            if LOGGER.isEnabledFor(logging.DEBUG):
+                LOGGER.debug("Executing yt-dlp with options: %s", _sanitize_opts_for_log(ranged_opts or ydl_opts))
+            for url in url_list:
+                results.append(
+                    _download_with_opts(
+                        ydl, url, clip_start_seconds, clip_end_seconds, durable, ranged_ydl, faststart
+                    )
+                )
+    except Exception:  # pragma: no cover - defensive
+        LOGGER.exception("Unexpected error while running yt-dlp for %d URL(s)", len(url_list))
+    results.extend(failed[len(results):])
+    return results
 
-    if auth_username:
-        ydl_opts["username"] = auth_username
-        if auth_password:
-            ydl_opts["password"] = auth_password
 
+def download_video(
+    url: str,
+    output_dir: Path,
+    filename: Optional[str] = None,
+    cookies_path: Optional[Path] = None,
+    username: Optional[str] = None,
+    password: Optional[str] = None,
+    clip_start: Optional[float] = None,
+    clip_end: Optional[float] = None,
+    concurrent_fragments: Optional[int] = None,
+    http_chunk_size: Optional[int] = None,
+    durable: bool = False,
+    faststart: bool = False,
+) -> Optional[Path]:
+    return download_videos(
+        [url],
+        output_dir,
+        filename,
+        cookies_path,
+        username,
+        password,
+        clip_start=clip_start,
+        clip_end=clip_end,
+        concurrent_fragments=concurrent_fragments,
+        http_chunk_size=http_chunk_size,
+        durable=durable,
+        faststart=faststart,
+    )[0]
+
+
+def _url_is_reachable(url: str) -> bool:
+    """HEAD the URL; only network failures and 5xx responses count as dead."""
+    if not url.lower().startswith(("http://", "https://")):
+        return True
+    import urllib.error
+    import urllib.request
+
+    request = urllib.request.Request(url, method="HEAD", headers={"User-Agent": _YOUTUBE_USER_AGENT})
     try:
-        log_opts = dict(ydl_opts)
-        if "password" in log_opts:
-            log_opts["password"] = "***"
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            LOGGER.debug("Executing yt-dlp with options: %s", log_opts)
-            info = ydl.extract_info(url, download=True)
-            requested = info.get("requested_downloads")
-            if requested:
-                file_path = Path(requested[0]["filepath"])
-                LOGGER.debug("yt-dlp reported requested download path %s", file_path)
-            else:
-                file_path = Path(ydl.prepare_filename(info))
-                ext = info.get("ext")
-                if ext:
-                    file_path = file_path.with_suffix(f".{ext}")
-                LOGGER.debug("Derived file path %s using metadata", file_path)
-            LOGGER.info("Downloaded %s -> %s", url, file_path)
-
-            if clip_start_seconds is not None or clip_end_seconds is not None:
-                LOGGER.info(
-                    "Clipping downloaded file %s (start=%s, end=%s)",
-                    file_path,
-                    clip_start_seconds,
-                    clip_end_seconds,
+        with urllib.request.urlopen(request, timeout=_PREFLIGHT_TIMEOUT_SECONDS):
+            return True
+    except urllib.error.HTTPError as exc:
+        # Many sites reject HEAD (405) or demand cookies (403) but still serve yt-dlp.
+        return exc.code < 500
+    except (OSError, ValueError):
+        return False
+
+
+def _preflight(urls: List[str]) -> List[bool]:
+    """Check URLs concurrently so dead links are dropped before yt-dlp is set up for them."""
+    workers = max(1, min(_PREFLIGHT_CONCURRENCY, len(urls)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="preflight") as executor:
+        return list(executor.map(_url_is_reachable, urls))
+
+
+def download_videos_parallel(
+    urls: Iterable[str],
+    output_dir: Path,
+    filename: Optional[str] = None,
+    cookies_path: Optional[Path] = None,
+    username: Optional[str] = None,
+    password: Optional[str] = None,
+    clip_start: Optional[float] = None,
+    clip_end: Optional[float] = None,
+    max_workers: Optional[int] = None,
+    concurrent_fragments: Optional[int] = None,
+    http_chunk_size: Optional[int] = None,
+    durable: bool = False,
+    faststart: bool = False,
+    preflight: bool = False,
+) -> List[Optional[Path]]:
+    """Download URLs concurrently, one YoutubeDL per worker thread.
+
+    ``max_workers`` defaults to VIDEODOWNLOADER_DOWNLOAD_WORKERS, or
+    min(4, cpu_count). Results are returned in input order, matching
+    download_videos. Unless overridden, each video also fetches fragments in
+    parallel and uses large ranged GETs so a single connection reaches
+    steady-state throughput. With ``preflight=True`` unreachable URLs are
+    reported as None without starting yt-dlp for them.
+    """
+    url_list = list(urls)
+    if not url_list:
+        return []
+    if preflight:
+        reachable = _preflight(url_list)
+        for url, ok in zip(url_list, reachable):
+            if not ok:
+                LOGGER.error("Skipping %s: the host did not answer a HEAD request.", url)
+        live_results = iter(
+            download_videos_parallel(
+                [url for url, ok in zip(url_list, reachable) if ok],
+                output_dir,
+                filename,
+                cookies_path,
+                username,
+                password,
+                clip_start=clip_start,
+                clip_end=clip_end,
+                max_workers=max_workers,
+                concurrent_fragments=concurrent_fragments,
+                http_chunk_size=http_chunk_size,
+                durable=durable,
+                faststart=faststart,
+            )
+        )
+        return [next(live_results) if ok else None for ok in reachable]
+    if max_workers is None:
+        max_workers = _DOWNLOAD_WORKERS
+    workers = max(1, min(int(max_workers), len(url_list)))
+    if workers == 1:
+        return download_videos(
+            url_list,
+            output_dir,
+            filename,
+            cookies_path,
+            username,
+            password,
+            clip_start=clip_start,
+            clip_end=clip_end,
+            concurrent_fragments=concurrent_fragments,
+            http_chunk_size=http_chunk_size,
+            durable=durable,
+            faststart=faststart,
+        )
+
+    LOGGER.info("Downloading %d URL(s) with %d worker(s)", len(url_list), workers)
+    results: List[Optional[Path]] = [None] * len(url_list)
+    executor = _download_pool(workers)
+    futures = {
+        executor.submit(
+            download_video,
+            url,
+            output_dir,
+            filename,
+            cookies_path,
+            username,
+            password,
+            clip_start=clip_start,
+            clip_end=clip_end,
+            concurrent_fragments=concurrent_fragments,
+            http_chunk_size=http_chunk_size,
+            durable=durable,
+            faststart=faststart,
+        ): index
+        for index, url in enumerate(url_list)
+    }
+    for future in as_completed(futures):
+        index = futures[future]
+        try:
+            results[index] = future.result()
+        except Exception:  # pragma: no cover - defensive
+            LOGGER.exception("Unexpected error during video download for %s", url_list[index])
+    return results
+
+
+async def download_many_async(
+    urls: Iterable[str],
+    output_dir: Path,
+    concurrency: int = 4,
+    **kwargs,
+) -> List[Optional[Path]]:
+    """Awaitable form of download_many for callers that already run an event loop.
+
+    Each download runs on the shared download pool; at most ``concurrency`` run at once.
+    """
+    import asyncio
+
+    workers = max(1, int(concurrency))
+    semaphore = asyncio.Semaphore(workers)
+    executor = _download_pool(workers)
+    loop = asyncio.get_running_loop()
+
+    async def _one(url: str) -> Optional[Path]:
+        async with semaphore:
+            try:
+                return await loop.run_in_executor(
+                    executor, functools.partial(download_video, url, output_dir, **kwargs)
                 )
-                clipped_path = _clip_media(file_path, clip_start_seconds, clip_end_seconds)
-                if clipped_path is None:
-                    LOGGER.error("Clipping failed; keeping original download but reporting failure.")
-                    return None
-                file_path = clipped_path
+            except Exception:  # pragma: no cover - defensive
+                LOGGER.exception("Unexpected error during video download for %s", url)
+                return None
 
-            return file_path
-    except yt_dlp.utils.DownloadError as err:
-        _log_download_error(url, str(err))
-    except Exception:  # pragma: no cover - defensive
-        LOGGER.exception("Unexpected error during video download for %s", url)
-    return None
+    return list(await asyncio.gather(*(_one(url) for url in urls)))
+
+
+def download_many(
+    urls: Iterable[str],
+    output_dir: Path,
+    concurrency: int = 4,
+    **kwargs,
+) -> List[Optional[Path]]:
+    """Download URLs on an asyncio event loop, at most ``concurrency`` at a time.
+
+    Extra keyword arguments are passed through to download_video. Results are
+    returned in input order. Must not be called from a running event loop; use
+    download_many_async there.
+    """
+    import asyncio
+
+    url_list = list(urls)
+    if not url_list:
+        return []
+    return asyncio.run(download_many_async(url_list, output_dir, concurrency, **kwargs))
+
+
+def _read_batch_file(path: str) -> List[str]:
+    """Read URLs from a batch file, one per line; blank lines and '#' comments are ignored."""
+    if path == "-":
+        lines = sys.stdin.read().splitlines()
+    else:
+        lines = Path(path).read_text(encoding="utf-8").splitlines()
+    urls = []
+    for line in lines:
+        cleaned = line.strip()
+        if cleaned and not cleaned.startswith("#"):
+            urls.append(cleaned)
+    return urls
 
 
 def main() -> int:
     import argparse
 
-    parser = argparse.ArgumentParser(description="Download a single video using yt-dlp.")
-    parser.add_argument("url", help="Video URL to download")
+    parser = argparse.ArgumentParser(
+        description="Download one or more videos using yt-dlp.",
+        epilog=f"Set {_FFMPEG_ENV_VAR} (or IMAGEIO_FFMPEG_EXE) to an ffmpeg binary to skip the PATH search.",
+    )
+    parser.add_argument("urls", nargs="*", metavar="url", help="Video URL(s) to download")
+    parser.add_argument(
+        "--batch-file",
+        help="File containing URLs to download, one per line ('-' reads from stdin)",
+    )
     parser.add_argument("--output-dir", default="downloads", help="Directory for saved videos")
     parser.add_argument("--filename", help="Optional base filename without extension")
     parser.add_argument("--cookies-file", help="Path to a cookies file in Netscape format")
     parser.add_argument("--username", help="Username for sites that require sign-in")
     parser.add_argument("--password", help="Password for sites that require sign-in")
+    parser.add_argument(
+        "--jobs",
+        "--concurrency",
+        dest="jobs",
+        type=int,
+        default=1,
+        help="Number of URLs to download concurrently",
+    )
+    parser.add_argument(
+        "--concurrent-fragments",
+        "--fragment-concurrency",
+        dest="concurrent_fragments",
+        type=int,
+        help="Number of HLS/DASH fragments yt-dlp fetches in parallel per video",
+    )
+    parser.add_argument(
+        "--ffmpeg-threads-per-invocation",
+        type=int,
+        help="Threads each ffmpeg clip may use (defaults to CPU count divided by the ffmpeg pool size)",
+    )
+    parser.add_argument(
+        "--prefer-premuxed",
+        action="store_true",
+        help="Prefer a single pre-muxed mp4 over merging the best separate video and audio streams",
+    )
+    parser.add_argument(
+        "--preflight",
+        action="store_true",
+        help="Send a HEAD request to each URL first and skip hosts that do not answer",
+    )
+    parser.add_argument(
+        "--faststart",
+        action="store_true",
+        help="Move the MP4 index of clipped files to the front so they can stream before fully downloading",
+    )
+    parser.add_argument(
+        "--durable",
+        action="store_true",
+        help="fsync clipped files and their directory before reporting success",
+    )
     parser.add_argument(
         "--log-level",
         default="INFO",
@@ -392,23 +1388,46 @@ def main() -> int:
 
     args = parser.parse_args()
     configure_logging(args.log_level)
-    result = download_video(
-        args.url,
+    _prewarm_yt_dlp()
+    urls = list(args.urls)
+    if args.batch_file:
+        try:
+            urls.extend(_read_batch_file(args.batch_file))
+        except OSError as exc:
+            parser.error(f"Unable to read batch file {args.batch_file}: {exc}")
+    if not urls:
+        parser.error("Provide at least one URL or --batch-file.")
+
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1.")
+    if args.ffmpeg_threads_per_invocation is not None:
+        if args.ffmpeg_threads_per_invocation < 1:
+            parser.error("--ffmpeg-threads-per-invocation must be at least 1.")
+        global _FFMPEG_THREADS
+        _FFMPEG_THREADS = args.ffmpeg_threads_per_invocation
+    if args.prefer_premuxed:
+        global _PREFER_PREMUXED
+        _PREFER_PREMUXED = True
+        _base_ydl_opts.cache_clear()
+
+    results = download_videos_parallel(
+        urls,
         Path(args.output_dir),
         args.filename,
         Path(args.cookies_file) if args.cookies_file else None,
         args.username,
         args.password,
+        max_workers=args.jobs,
+        concurrent_fragments=args.concurrent_fragments,
+        durable=args.durable,
+        faststart=args.faststart,
+        preflight=args.preflight,
     )
-    if result:
-        print(result)
-        return 0
-    return 1
+    for result in results:
+        if result:
+            print(result)
+    return 0 if all(results) else 1
 
 
 if __name__ == "__main__":
     sys.exit(main())
-
-
-
-
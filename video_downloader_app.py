@@ -3,21 +3,23 @@ Streamlit interface for the minimal video downloader.
 """
 import csv
 import logging
+import threading
 import zipfile
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from datetime import datetime, timezone
-from io import BytesIO, StringIO
+from io import BytesIO, StringIO, TextIOWrapper
 from pathlib import Path
 from tempfile import NamedTemporaryFile
-from typing import Dict, List, Optional, Tuple
+from typing import Deque, Dict, List, Optional, Tuple
 
 import streamlit as st
 import html
 
 from video_downloader import (
-    FFMPEG_AVAILABLE,
-    FFMPEG_PATH,
     LOGGER,
     download_video,
+    ffmpeg_available,
     parse_time_to_seconds,
     yt_dlp_version_status,
 )
@@ -25,18 +27,25 @@ from video_downloader import (
 LOG_FORMAT = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
 LOG_DATEFMT = "%H:%M:%S"
 DEFAULT_OUTPUT_DIR = Path("downloads")
+# CSV rows downloaded at once; each row waits on the network and ffmpeg, so threads overlap well.
+BATCH_DOWNLOAD_WORKERS = 4
+# Downloads submitted but not yet recorded; keeps a paused or failed run from queueing the whole CSV.
+BATCH_MAX_IN_FLIGHT = BATCH_DOWNLOAD_WORKERS * 2
 
 STATUS_COLUMN = "Download Status"
 DETAIL_COLUMN = "Download Detail"
 PATH_COLUMN = "Download Path"
 TIMESTAMP_COLUMN = "Processed At"
 COMPLETED_STATUS_VALUES = {"downloaded", "success"}
-URL_COLUMN_CANDIDATES = ("url", "link", "links")
-SKIP_COLUMN_CANDIDATES = ("skip",)
+URL_COLUMN_CANDIDATES = frozenset({"url", "link", "links"})
+SKIP_COLUMN_CANDIDATES = frozenset({"skip"})
 CLIP_START_COLUMN = "Clip Start Time"
 CLIP_END_COLUMN = "Clip End Time"
-CLIP_START_COLUMN_CANDIDATES = ("clip start time", "clip start", "clip_start", "start time")
-CLIP_END_COLUMN_CANDIDATES = ("clip end time", "clip end", "clip_end", "end time")
+CLIP_START_COLUMN_CANDIDATES = frozenset({"clip start time", "clip start", "clip_start", "start time"})
+CLIP_END_COLUMN_CANDIDATES = frozenset({"clip end time", "clip end", "clip_end", "end time"})
+
+# Oldest captured log lines are dropped beyond this, so long batches keep bounded memory.
+LOG_CAPTURE_LINES = 5000
 
 MIME_BY_SUFFIX = {
     ".mp4": "video/mp4",
@@ -45,6 +54,25 @@ MIME_BY_SUFFIX = {
     ".mov": "video/quicktime",
 }
 
+
+class _LogCapture(logging.Handler):
+    """Keep the most recent formatted downloader log lines for display in the app."""
+
+    def __init__(self, capacity: int = LOG_CAPTURE_LINES) -> None:
+        super().__init__(logging.INFO)
+        self.setFormatter(logging.Formatter(LOG_FORMAT, datefmt=LOG_DATEFMT))
+        self.lines: Deque[str] = deque(maxlen=capacity)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.lines.append(self.format(record))
+        except Exception:  # pragma: no cover - mirrors logging.StreamHandler
+            self.handleError(record)
+
+    def getvalue(self) -> str:
+        return "\n".join(self.lines).strip()
+
+
 def _path_relative_to_workspace(path: Path) -> str:
     """Return path relative to the working directory when possible."""
     try:
@@ -55,6 +83,43 @@ def _path_relative_to_workspace(path: Path) -> str:
 
 
 
+def _file_download_button(target, label: str, path: Path, key: Optional[str] = None) -> None:
+    """Render a download button fed from an open file handle rather than a bytes copy of the file."""
+    mime = MIME_BY_SUFFIX.get(path.suffix.lower(), "application/octet-stream")
+    with path.open("rb") as handle:
+        target.download_button(label, data=handle, file_name=path.name, mime=mime, key=key)
+
+
+@st.fragment
+def _batch_row_download(saved_path: Path, row_number) -> None:
+    """Read a batch row's file only once it is requested; the click reruns just this cell."""
+    ready_key = f"table_download_ready_{row_number}_{saved_path}"
+    if not st.session_state.get(ready_key):
+        if not st.button("Prepare", key=f"table_prepare_{row_number}"):
+            return
+        st.session_state[ready_key] = True
+    try:
+        _file_download_button(st, "Download", saved_path, key=f"table_download_{row_number}")
+    except OSError as exc:
+        st.write(f"Unavailable ({exc})")
+
+
+def _read_uploaded_csv(csv_file) -> Optional[Tuple[Optional[List[str]], List[dict]]]:
+    """Parse an uploaded CSV straight from its buffer; returns None if no encoding fits."""
+    for encoding in ("utf-8-sig", "cp1252"):
+        csv_file.seek(0)
+        text = TextIOWrapper(csv_file, encoding=encoding, newline="")
+        try:
+            reader = csv.DictReader(text)
+            return reader.fieldnames, list(reader)
+        except UnicodeDecodeError:
+            continue
+        finally:
+            # Detach so the wrapper doesn't close the uploaded file when it is collected.
+            text.detach()
+    return None
+
+
 def _find_matching_column(fieldnames: Optional[List[str]], target: str) -> Optional[str]:
     """Return the first column whose lowercase matches the provided target."""
     if not fieldnames or not target:
@@ -159,19 +224,8 @@ def _display_batch_results(data: dict, controls_container=None) -> None:
                     saved_path = Path(download_info.get("path", ""))
                     display_name = download_info.get("display_name") or saved_path.name
                     if saved_path.exists():
-                        try:
-                            file_bytes = saved_path.read_bytes()
-                            suffix = saved_path.suffix.lower()
-                            mime = MIME_BY_SUFFIX.get(suffix, "application/octet-stream")
-                            download_cell.download_button(
-                                "Download",
-                                data=file_bytes,
-                                file_name=saved_path.name,
-                                mime=mime,
-                                key=f"table_download_{row_number}",
-                            )
-                        except OSError as exc:
-                            download_cell.write(f"Unavailable ({exc})")
+                        with download_cell:
+                            _batch_row_download(saved_path, row_number)
                     else:
                         download_cell.write("File missing")
                 else:
@@ -246,6 +300,17 @@ def _display_batch_results(data: dict, controls_container=None) -> None:
 
 
 
+def _batch_output_key(url_value: str, filename_value: Optional[str]) -> str:
+    """Identify the file a batch row writes, so rows sharing one are never downloaded at once."""
+    name = (filename_value or "").strip()
+    if name and "%(" not in name:
+        # "clip" and "clip.mp4" can land on the same file; compare loosely and case-insensitively.
+        return "file:" + Path(name).stem.casefold()
+    # A templated name (the default is %(title)s) resolves the same for every row of one URL,
+    # e.g. several clips cut from the same video.
+    return "url:" + url_value
+
+
 def _process_batch(context: dict, pause_limit: int, skip_completed: bool) -> Optional[dict]:
     rows = context.get("rows") or []
     total = len(rows)
@@ -254,30 +319,47 @@ def _process_batch(context: dict, pause_limit: int, skip_completed: bool) -> Opt
     context["skip_completed_default"] = skip_completed
     context["last_pause_limit"] = pause_limit
 
-    log_buffer = StringIO()
-    handler = logging.StreamHandler(log_buffer)
-    handler.setLevel(logging.INFO)
-    handler.setFormatter(logging.Formatter(LOG_FORMAT, datefmt=LOG_DATEFMT))
+    log_capture = _LogCapture()
+    previous_level = LOGGER.level
+    LOGGER.addHandler(log_capture)
+    LOGGER.setLevel(logging.INFO)
 
-    root_logger = logging.getLogger()
-    previous_root_level = root_logger.level
-    root_logger.addHandler(handler)
-    root_logger.setLevel(logging.INFO)
-
-    yt_logger = logging.getLogger("yt_dlp")
-    previous_yt_level = yt_logger.level
-    yt_logger.setLevel(logging.INFO)
-
-    temp_cookie_path: Optional[Path] = None
+    executor: Optional[ThreadPoolExecutor] = None
     cookies_bytes = context.get("cookies_bytes")
-    cookies_name = context.get("cookies_name") or "cookies.txt"
-    try:
+    cookies_suffix = Path(context.get("cookies_name") or "cookies.txt").suffix or ".txt"
+    # YoutubeDL rewrites its cookies file on close, so each worker thread gets its own copy.
+    worker_state = threading.local()
+    worker_cookie_paths: List[Path] = []
+    finished_rows = set()
+
+    def copy_cookies_for_worker() -> None:
+        worker_state.cookies_path = None
         if cookies_bytes:
-            suffix = Path(cookies_name).suffix or ".txt"
-            with NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
+            with NamedTemporaryFile(delete=False, suffix=cookies_suffix) as tmp:
                 tmp.write(cookies_bytes)
-                temp_cookie_path = Path(tmp.name)
+            worker_state.cookies_path = Path(tmp.name)
+            worker_cookie_paths.append(worker_state.cookies_path)
+
+    def download_row(
+        url_value: str, filename_value: Optional[str], clip_start: Optional[float], clip_end: Optional[float]
+    ) -> Optional[Path]:
+        return download_video(
+            url_value,
+            DEFAULT_OUTPUT_DIR,
+            filename_value,
+            worker_state.cookies_path,
+            clip_start=clip_start,
+            clip_end=clip_end,
+        )
+
+    def mark_row_finished(zero_idx: int) -> None:
+        # Only the finished prefix counts as done, so a rerun never skips a row that was still downloading.
+        finished_rows.add(zero_idx)
+        while context["next_row"] in finished_rows:
+            finished_rows.discard(context["next_row"])
+            context["next_row"] += 1
 
+    try:
         progress_slot = st.session_state.get("batch_progress_placeholder")
         if progress_slot is None:
             progress_slot = st.empty()
@@ -330,7 +412,7 @@ def _process_batch(context: dict, pause_limit: int, skip_completed: bool) -> Opt
 
         def update_placeholders(row_number: int, status_text: str) -> None:
             if progress and total:
-                progress.progress(min(1.0, row_number / total))
+                progress.progress(min(1.0, context["next_row"] / total))
             row_line = f"Row {row_number}/{total}: {status_text}"
             counts_line = (
                 f"✅ Downloads: {downloaded_total} | ❌ Failures: {failed_total} | ⚪ Skipped: {skipped_total}"
@@ -339,13 +421,57 @@ def _process_batch(context: dict, pause_limit: int, skip_completed: bool) -> Opt
             st.session_state["batch_live_row_text"] = row_line
             st.session_state["batch_live_counts_text"] = counts_line
             if log_placeholder:
-                log_lines = log_buffer.getvalue().strip().splitlines()
+                log_lines = list(log_capture.lines)
                 if log_lines:
                     recent = "\n".join(log_lines[-12:])
                     log_placeholder.text(recent)
                 else:
                     log_placeholder.text("Logs will appear here while the batch runs.")
 
+        def record_download(future, index: int, url_value: str, filename_value: Optional[str], row_dict: dict) -> None:
+            nonlocal downloaded_total, failed_total
+            try:
+                saved_path = future.result()
+            except Exception:  # pragma: no cover - download_video logs and returns None itself
+                LOGGER.exception("Unexpected error during video download for %s", url_value)
+                saved_path = None
+            if saved_path:
+                saved_path = Path(saved_path)
+                detail_message = str(saved_path)
+                results.append({"Row": index, "URL": url_value, "Status": "downloaded", "Detail": detail_message})
+                downloadable_items.append(
+                    {
+                        "row": index,
+                        "path": str(saved_path),
+                        "display_name": filename_value or saved_path.name,
+                    }
+                )
+                set_row_status(row_dict, "downloaded", detail_message, saved_path)
+                downloaded_total += 1
+            else:
+                detail_message = "Download failed."
+                results.append({"Row": index, "URL": url_value, "Status": "failed", "Detail": detail_message})
+                set_row_status(row_dict, "failed", detail_message)
+                failed_total += 1
+            mark_row_finished(index - 1)
+            update_placeholders(index, detail_message)
+
+        def collect_finished(block: bool = True) -> None:
+            # Results are recorded on this thread; Streamlit elements can't be updated from the workers.
+            if not pending:
+                return
+            done, _ = wait(pending, timeout=None if block else 0, return_when=FIRST_COMPLETED)
+            for future in sorted(done, key=lambda item: pending[item][0]):
+                pending_targets.pop(future, None)
+                record_download(future, *pending.pop(future))
+
+        executor = ThreadPoolExecutor(
+            max_workers=BATCH_DOWNLOAD_WORKERS,
+            thread_name_prefix="batch-download",
+            initializer=copy_cookies_for_worker,
+        )
+        pending: Dict[Future, Tuple[int, str, Optional[str], dict]] = {}
+        pending_targets: Dict[Future, str] = {}
         if start_index >= total:
             st.session_state["batch_live_active"] = False
             status_placeholder.info("All rows in this batch have already been processed.")
@@ -370,8 +496,8 @@ def _process_batch(context: dict, pause_limit: int, skip_completed: bool) -> Opt
                         )
                         set_row_status(row, "skipped", detail_message)
                         skipped_total += 1
+                        mark_row_finished(zero_idx)
                         update_placeholders(index, detail_message)
-                        context["next_row"] = zero_idx + 1
                         if pause_limit and processed_in_run >= pause_limit:
                             pause_triggered = True
                             break
@@ -391,7 +517,7 @@ def _process_batch(context: dict, pause_limit: int, skip_completed: bool) -> Opt
                         )
                         set_row_status(row, "skipped", detail_message)
                         skipped_total += 1
-                        context["next_row"] = zero_idx + 1
+                        mark_row_finished(zero_idx)
                         update_placeholders(index, detail_message)
                         if pause_limit and processed_in_run >= pause_limit:
                             pause_triggered = True
@@ -404,7 +530,7 @@ def _process_batch(context: dict, pause_limit: int, skip_completed: bool) -> Opt
                     results.append({"Row": index, "URL": "", "Status": "skipped", "Detail": detail_message})
                     set_row_status(row, "skipped", detail_message)
                     skipped_total += 1
-                    context["next_row"] = zero_idx + 1
+                    mark_row_finished(zero_idx)
                     update_placeholders(index, detail_message)
                     if pause_limit and processed_in_run >= pause_limit:
                         pause_triggered = True
@@ -440,7 +566,7 @@ def _process_batch(context: dict, pause_limit: int, skip_completed: bool) -> Opt
                     and clip_end_seconds <= clip_start_seconds
                 ):
                     row_errors.append("Clip end time must be greater than clip start time.")
-                if (clip_start_seconds is not None or clip_end_seconds is not None) and not FFMPEG_AVAILABLE:
+                if (clip_start_seconds is not None or clip_end_seconds is not None) and not ffmpeg_available():
                     row_errors.append("ffmpeg not available for clipping.")
 
                 if row_errors:
@@ -455,48 +581,33 @@ def _process_batch(context: dict, pause_limit: int, skip_completed: bool) -> Opt
                     )
                     set_row_status(row, "failed", detail_message)
                     failed_total += 1
-                    context["next_row"] = zero_idx + 1
+                    mark_row_finished(zero_idx)
                     update_placeholders(index, detail_message)
                     if pause_limit and processed_in_run >= pause_limit:
                         pause_triggered = True
                         break
                     continue
 
-                saved_path = download_video(
-                    url_value,
-                    DEFAULT_OUTPUT_DIR,
-                    filename_value,
-                    temp_cookie_path,
-                    clip_start=clip_start_seconds,
-                    clip_end=clip_end_seconds,
-                )
-                if saved_path:
-                    saved_path = Path(saved_path)
-                    detail_message = str(saved_path)
-                    results.append({"Row": index, "URL": url_value, "Status": "downloaded", "Detail": detail_message})
-                    downloadable_items.append(
-                        {
-                            "row": index,
-                            "path": str(saved_path),
-                            "display_name": filename_value or saved_path.name,
-                        }
-                    )
-                    set_row_status(row, "downloaded", detail_message, saved_path)
-                    downloaded_total += 1
-                else:
-                    detail_message = "Download failed."
-                    results.append({"Row": index, "URL": url_value, "Status": "failed", "Detail": detail_message})
-                    set_row_status(row, "failed", detail_message)
-                    failed_total += 1
-
-                context["next_row"] = zero_idx + 1
-                update_placeholders(index, detail_message)
+                # Rows writing the same file would share a .part file and clip it in place concurrently.
+                target_key = _batch_output_key(url_value, filename_value)
+                while len(pending) >= BATCH_MAX_IN_FLIGHT or target_key in pending_targets.values():
+                    collect_finished()
+                future = executor.submit(download_row, url_value, filename_value, clip_start_seconds, clip_end_seconds)
+                pending[future] = (index, url_value, filename_value, row)
+                pending_targets[future] = target_key
+                update_placeholders(index, "Queued for download.")
+                collect_finished(block=False)
 
                 if pause_limit and processed_in_run >= pause_limit:
                     pause_triggered = True
-                    update_placeholders(index, f"Paused automatically after {pause_limit} row(s).")
                     break
 
+            while pending:
+                collect_finished()
+            results.sort(key=lambda item: item["Row"])
+            if pause_triggered:
+                update_placeholders(index, f"Paused automatically after {pause_limit} row(s).")
+
         if not pause_triggered:
             context["next_row"] = total
 
@@ -512,18 +623,22 @@ def _process_batch(context: dict, pause_limit: int, skip_completed: bool) -> Opt
         else:
             status_placeholder.empty()
     finally:
+        if executor is not None:
+            # Drop queued rows if the run was interrupted, but let running downloads finish before
+            # their log handler and cookies files go away.
+            executor.shutdown(wait=True, cancel_futures=True)
         st.session_state["batch_live_active"] = False
         st.session_state["batch_live_row_text"] = None
         st.session_state["batch_live_counts_text"] = None
-        handler.flush()
-        root_logger.removeHandler(handler)
-        root_logger.setLevel(previous_root_level)
-        yt_logger.setLevel(previous_yt_level)
-        if temp_cookie_path and temp_cookie_path.exists():
+        LOGGER.removeHandler(log_capture)
+        LOGGER.setLevel(previous_level)
+        for cookie_path in worker_cookie_paths:
+            if not cookie_path.exists():
+                continue
             try:
-                temp_cookie_path.unlink()
+                cookie_path.unlink()
             except OSError:
-                LOGGER.warning("Failed to remove temporary cookies file at %s", temp_cookie_path)
+                LOGGER.warning("Failed to remove temporary cookies file at %s", cookie_path)
 
     fieldnames = context.get("fieldnames") or []
     status_column = context["status_column"]
@@ -613,7 +728,7 @@ def _process_batch(context: dict, pause_limit: int, skip_completed: bool) -> Opt
     success_count = sum(1 for item in results if item["Status"] == "downloaded")
     failure_count = sum(1 for item in results if item["Status"] == "failed")
     skipped_count = sum(1 for item in results if item["Status"] == "skipped")
-    batch_log_output = log_buffer.getvalue().strip()
+    batch_log_output = log_capture.getvalue()
     remaining_rows = max(0, total - context.get("next_row", total))
 
     batch_results = {
@@ -729,7 +844,7 @@ st.caption(
     "- Does not work with some reigon-gated YouTube videos or livestreams\n"
     "- Long videos and large batch downloads can cause crashes"
             )
-if not FFMPEG_AVAILABLE:
+if not ffmpeg_available():
     st.warning("ffmpeg not detected. Install ffmpeg to enable audio/video clipping and proper muxing.")
 
 if "batch_progress_placeholder" not in st.session_state:
@@ -798,29 +913,18 @@ if submitted:
                 and clip_end_seconds <= clip_start_seconds
             ):
                 validation_errors.append("Clip end time must be greater than clip start time.")
-            if (clip_start_seconds is not None or clip_end_seconds is not None) and not FFMPEG_AVAILABLE:
+            if (clip_start_seconds is not None or clip_end_seconds is not None) and not ffmpeg_available():
                 validation_errors.append("Clipping requires ffmpeg, which was not detected.")
 
             if validation_errors:
                 for message in validation_errors:
                     st.error(message)
             else:
+                log_capture = _LogCapture()
+                previous_level = LOGGER.level
+                LOGGER.addHandler(log_capture)
                 LOGGER.setLevel(logging.INFO)
 
-                log_buffer = StringIO()
-                handler = logging.StreamHandler(log_buffer)
-                handler.setLevel(logging.INFO)
-                handler.setFormatter(logging.Formatter(LOG_FORMAT, datefmt=LOG_DATEFMT))
-
-                root_logger = logging.getLogger()
-                previous_root_level = root_logger.level
-                root_logger.addHandler(handler)
-                root_logger.setLevel(logging.INFO)
-
-                yt_logger = logging.getLogger("yt_dlp")
-                previous_yt_level = yt_logger.level
-                yt_logger.setLevel(logging.INFO)
-
                 output_dir = DEFAULT_OUTPUT_DIR
                 result = None
                 temp_cookie_path: Optional[Path] = None
@@ -841,17 +945,15 @@ if submitted:
                             clip_end=clip_end_seconds,
                         )
                 finally:
-                    handler.flush()
-                    root_logger.removeHandler(handler)
-                    root_logger.setLevel(previous_root_level)
-                    yt_logger.setLevel(previous_yt_level)
+                    LOGGER.removeHandler(log_capture)
+                    LOGGER.setLevel(previous_level)
                     if temp_cookie_path and temp_cookie_path.exists():
                         try:
                             temp_cookie_path.unlink()
                         except OSError:
                             LOGGER.warning("Failed to remove temporary cookies file at %s", temp_cookie_path)
 
-                log_output = log_buffer.getvalue().strip()
+                log_output = log_capture.getvalue()
                 if result:
                     result_path = Path(result)
                     st.success(f"Saved to {result_path}")
@@ -859,17 +961,9 @@ if submitted:
                         "The file path above is relative to where Streamlit is running. Files save under 'downloads/'."
                     )
 
-                    file_bytes = result_path.read_bytes() if result_path.exists() else None
-                    if file_bytes:
-                        suffix = result_path.suffix.lower()
-                        mime = MIME_BY_SUFFIX.get(suffix, "application/octet-stream")
-                        st.download_button(
-                            "Download video",
-                            data=file_bytes,
-                            file_name=result_path.name,
-                            mime=mime,
-                        )
-                    else:
+                    try:
+                        _file_download_button(st, "Download video", result_path)
+                    except OSError:
                         st.warning("Downloaded file could not be read for download.")
                 else:
                     st.error("Download failed. Check the logs for more details.")
@@ -925,13 +1019,14 @@ with batch_download_expander:
             csv_data = csv_cache
     else:
         if csv_file:
-            csv_bytes = csv_file.getvalue()
+            # Size the upload without copying it; it is only parsed when the signature changes.
+            csv_size = csv_file.getbuffer().nbytes
             file_signature = {
                 "name": getattr(csv_file, "name", ""),
-                "size": len(csv_bytes or b""),
+                "size": csv_size,
             }
             csv_cache = st.session_state.get(csv_cache_key)
-            if not csv_bytes:
+            if not csv_size:
                 st.error("Uploaded CSV file is empty.")
                 st.session_state.pop(csv_cache_key, None)
                 st.session_state.pop(column_map_key, None)
@@ -939,22 +1034,15 @@ with batch_download_expander:
                 csv_data = None
             else:
                 if not csv_cache or csv_cache.get("signature") != file_signature:
-                    decoded = None
-                    for encoding in ("utf-8-sig", "utf-8", "cp1252"):
-                        try:
-                            decoded = csv_bytes.decode(encoding)
-                            break
-                        except UnicodeDecodeError:
-                            continue
-                    if decoded is None:
+                    parsed = _read_uploaded_csv(csv_file)
+                    if parsed is None:
                         st.error("Could not decode CSV file. Please upload UTF-8 encoded CSVs.")
                         st.session_state.pop(csv_cache_key, None)
                         st.session_state.pop(column_map_key, None)
                         csv_cache = None
                         csv_data = None
                     else:
-                        reader = csv.DictReader(StringIO(decoded))
-                        fieldnames = reader.fieldnames
+                        fieldnames, rows = parsed
                         if not fieldnames:
                             st.error("CSV file has no header row to identify columns.")
                             st.session_state.pop(csv_cache_key, None)
@@ -962,7 +1050,6 @@ with batch_download_expander:
                             csv_cache = None
                             csv_data = None
                         else:
-                            rows = list(reader)
                             url_candidate = next(
                                 (
                                     col